@@ -1,13 +1,26 @@
+import functools
+import hashlib
 import json
 import os
 import re
 import requests
-import time
+import shutil
+import threading
 from collections import Counter
-from multiprocessing import Process
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import takewhile
+from urllib.parse import urljoin, urlparse
 from dotenv import load_dotenv 
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import fcntl  # POSIX-only; used to serialize writes to the translation cache
+except ImportError:
+    fcntl = None
 
 # Third-party libraries
+from lxml import html as lxml_html
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options as ChromeOptions
@@ -21,11 +34,26 @@ from selenium.common.exceptions import TimeoutException, NoSuchElementException,
 # --- CONFIGURATION AND SETUP ---
 
 BASE_URL = "https://elpais.com"
+OPINION_URL_PREFIX = f"{BASE_URL}/opinion/"
 IMAGES_DIR = "scraped_images"
+os.makedirs(IMAGES_DIR, exist_ok=True)
+TRANSLATION_CACHE_FILE = "translations_cache.json"
+IMAGE_CHUNK_SIZE = 64 * 1024
+MAX_IMAGE_BYTES = 20 * 1024 * 1024
+PAGE_LOAD_TIMEOUT = 15
+
+# Pre-compiled patterns and constants used during analysis and file naming
+_WORD_RE = re.compile(r'\b\w+\b')
+_UNSAFE_CHARS_RE = re.compile(r'[^a-zA-Z0-9]')
+_STOP_WORDS = frozenset({'the', 'a', 'an', 'and', 'to', 'in', 'is', 'it', 'for', 'of', 'on', 'with', 'from', 'at', 'by'})
 
 # Load environment variables from .env file
 load_dotenv()
 
+# RapidAPI credentials for translation
+_RAPID_API_KEY = os.getenv("RAPID_API_KEY")
+_RAPID_API_HOST = os.getenv("RAPID_API_HOST")
+
 # Load BrowserStack credentials and capabilities
 try:
     with open('config.json', 'r') as f:
@@ -59,52 +87,308 @@ except Exception as e:
     exit(1)
 
 
-def rapidapi_translate(text, source_lang, target_lang):
+# --- HTTP SESSION (KEEP-ALIVE) ---
+
+_SESSION = None
+_SESSION_PID = None
+_SESSION_LOCK = threading.Lock()
+
+
+def get_http_session():
+    """
+    Returns a process-local requests.Session with a pooled, retrying HTTPS adapter.
+    The session is created lazily and shared by all scraper threads in the process.
     """
-    Translates text using Rapid Translate Multi Traduction API via requests.
+    global _SESSION, _SESSION_PID
+    with _SESSION_LOCK:
+        if _SESSION is None or _SESSION_PID != os.getpid():
+            session = requests.Session()
+            # Sized for 5 parallel sessions each fetching up to 5 pages concurrently
+            adapter = HTTPAdapter(
+                pool_connections=10,
+                pool_maxsize=25,
+                max_retries=Retry(total=3, backoff_factor=0.3)
+            )
+            session.mount("https://", adapter)
+            _SESSION = session
+            _SESSION_PID = os.getpid()
+        return _SESSION
+
+
+# --- TRANSLATION ---
+
+_TRANSLATION_CACHE = None
+_TRANSLATION_CACHE_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=256)
+def _translation_cache_key(text, source_lang, target_lang):
+    """Builds the cache key for a translation: sha256 of source|target|text."""
+    return hashlib.sha256(f"{source_lang}|{target_lang}|{text}".encode("utf-8")).hexdigest()
+
+
+def _read_translation_cache_file(f):
+    """Parses the cache file contents, treating an empty or corrupt file as an empty cache."""
+    f.seek(0)
+    try:
+        data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except ValueError:
+        return {}
+
+
+def _load_translation_cache():
+    """Loads the on-disk translation cache once per process."""
+    global _TRANSLATION_CACHE
+    if _TRANSLATION_CACHE is None:
+        cache = {}
+        if os.path.exists(TRANSLATION_CACHE_FILE):
+            try:
+                with open(TRANSLATION_CACHE_FILE, 'r', encoding='utf-8') as f:
+                    if fcntl:
+                        fcntl.flock(f, fcntl.LOCK_SH)
+                    cache = _read_translation_cache_file(f)
+            except OSError as e:
+                print(f"Warning: Could not read {TRANSLATION_CACHE_FILE}: {e}")
+        _TRANSLATION_CACHE = cache
+    return _TRANSLATION_CACHE
+
+
+def _save_translation_cache(entries):
+    """Merges new entries into the on-disk cache under an exclusive file lock."""
+    try:
+        with open(TRANSLATION_CACHE_FILE, 'a+', encoding='utf-8') as f:
+            if fcntl:
+                fcntl.flock(f, fcntl.LOCK_EX)
+            cache = _read_translation_cache_file(f)
+            cache.update(entries)
+            f.seek(0)
+            f.truncate()
+            json.dump(cache, f, ensure_ascii=False)
+    except OSError as e:
+        print(f"Warning: Could not write {TRANSLATION_CACHE_FILE}: {e}")
+
+
+def _rapidapi_request(texts, source_lang, target_lang):
+    """
+    Sends one batch request to the Rapid Translate Multi Traduction API.
+    Returns the list of translations, or None if the API credentials are not configured.
     Credentials are loaded from environment variables: RAPID_API_KEY and RAPID_API_HOST.
     """
-    load_dotenv()
-    api_key = os.getenv("RAPID_API_KEY")
-    api_host = os.getenv("RAPID_API_HOST")
-    if not api_key or not api_host:
+    if not _RAPID_API_KEY or not _RAPID_API_HOST:
         print("Warning: RAPID_API_KEY and RAPID_API_HOST not set. Skipping translation.")
-        return "[Translation not configured]"
+        return None
 
-    url = f"https://{api_host}/t"
+    url = f"https://{_RAPID_API_HOST}/t"
     headers = {
-        "x-rapidapi-key": api_key,
-        "x-rapidapi-host": api_host,
+        "x-rapidapi-key": _RAPID_API_KEY,
+        "x-rapidapi-host": _RAPID_API_HOST,
         "Content-Type": "application/json"
     }
     payload = {
         "from": source_lang,
         "to": target_lang,
-        "q": text
+        "q": texts
     }
 
+    response = get_http_session().post(url, json=payload, headers=headers, timeout=15)
+    response.raise_for_status()
+    result = response.json()
+    # Expected format may vary, try multiple paths
+    if isinstance(result, list) and len(result) == len(texts):
+        return [
+            r if isinstance(r, str) else r.get('translatedText', r.get('translated', ''))
+            for r in result
+        ]
+    elif isinstance(result, dict) and len(texts) == 1:
+        translated = result.get('translatedText', result.get('translated'))
+        if translated:
+            return [translated]
+    raise ValueError(f"Unexpected response format: {str(result)[:50]}")
+
+
+def rapidapi_translate_many(texts, source_lang, target_lang):
+    """
+    Translates a batch of texts, returning translations in the same order as the input.
+    Cached translations are served from translations_cache.json; the remaining texts
+    are sent to the Rapid Translate Multi Traduction API in a single request.
+    """
+    texts = list(texts)
+    if not texts:
+        return []
+
+    keys = [_translation_cache_key(text, source_lang, target_lang) for text in texts]
+    with _TRANSLATION_CACHE_LOCK:
+        cache = _load_translation_cache()
+        cached = {key: cache[key] for key in keys if key in cache}
+
+    # Deduplicate misses so repeated titles are only translated once
+    missing = list({key: text for key, text in zip(keys, texts) if key not in cached}.items())
+    if missing:
+        try:
+            translations = _rapidapi_request([text for _, text in missing], source_lang, target_lang)
+        except Exception as e:
+            print(f"Translation Error (RapidAPI): {e}")
+            fallback = f"[Translation failed: {str(e)[:50]}]"
+            return [cached.get(key, fallback) for key in keys]
+
+        if translations is None:
+            return [cached.get(key, "[Translation not configured]") for key in keys]
+
+        new_entries = {key: translated for (key, _), translated in zip(missing, translations) if translated}
+        with _TRANSLATION_CACHE_LOCK:
+            cache.update(new_entries)
+            _save_translation_cache(new_entries)
+        cached.update(new_entries)
+
+    return [cached.get(key, text) for key, text in zip(keys, texts)]
+
+
+def rapidapi_translate(text, source_lang, target_lang):
+    """Translates a single text. Thin wrapper around rapidapi_translate_many."""
+    return rapidapi_translate_many([text], source_lang, target_lang)[0]
+
+# --- IN-BROWSER EXTRACTION SCRIPTS ---
+
+# Collects {url, title} candidates from the Opinion listing in a single WebDriver call.
+# arguments[0] is the list of container selectors, tried in order until one yields >= 5 elements.
+EXTRACT_ARTICLE_LINKS_JS = """
+const selectors = arguments[0];
+let elements = [];
+for (const sel of selectors) {
+    try {
+        elements = Array.from(document.querySelectorAll(sel));
+    } catch (e) {
+        continue;  // e.g. :has() is not supported by older browsers
+    }
+    if (elements.length >= 5) break;
+}
+const titleSelectors = ['h2', 'h3', '.c_t', '[data-dtm-region] a', 'a'];
+return elements.slice(0, 50).map(el => {
+    const link = el.tagName === 'A' ? el : (el.querySelector('a[href*="/opinion/"]') || el.querySelector('a'));
+    let title = '';
+    for (const sel of titleSelectors) {
+        const t = el.querySelector(sel);
+        title = t ? (t.innerText || '').trim() : '';
+        if (title) break;
+    }
+    return {url: link ? link.href : null, title: title};
+});
+"""
+
+# Extracts title, content and cover image URL from an article page in a single WebDriver call.
+EXTRACT_ARTICLE_PAGE_JS = """
+const first = (selectors, read) => {
+    for (const sel of selectors) {
+        for (const el of document.querySelectorAll(sel)) {
+            const value = read(el);
+            if (value) return value;
+        }
+    }
+    return null;
+};
+const text = el => (el.innerText || '').trim();
+return {
+    title: first(['h1, header h1, .a_t, .article-header h1, [data-dtm-region="articulo_titulo"]'], text),
+    content: first(['article[data-dtm-region], .article_body, .a_c, article, .articulo-cuerpo'],
+                   el => text(el).length > 50 ? text(el) : null),
+    image_url: first(['article img, figure img, .a_m img, [data-dtm-region] img', 'img'], el => {
+        const src = el.getAttribute('src') || el.getAttribute('data-src');
+        return src && (src.includes('http') || src.startsWith('/')) ? src : null;
+    }),
+};
+"""
+
+# --- STATIC ARTICLE PARSING ---
+
+# XPath equivalents of the Selenium selectors used for article pages
+ARTICLE_TITLE_XPATHS = [
+    "//h1",
+    "//*[contains(concat(' ', normalize-space(@class), ' '), ' a_t ')]",
+    "//*[@data-dtm-region='articulo_titulo']",
+]
+ARTICLE_CONTENT_XPATHS = [
+    "//article[@data-dtm-region]",
+    "//*[contains(concat(' ', normalize-space(@class), ' '), ' article_body ')]",
+    "//*[contains(concat(' ', normalize-space(@class), ' '), ' a_c ')]",
+    "//article",
+    "//*[contains(concat(' ', normalize-space(@class), ' '), ' articulo-cuerpo ')]",
+]
+ARTICLE_IMAGE_XPATHS = [
+    "//article//img",
+    "//figure//img",
+    "//*[contains(concat(' ', normalize-space(@class), ' '), ' a_m ')]//img",
+    "//*[@data-dtm-region]//img",
+    "//img",
+]
+
+
+def _element_text(element):
+    """Returns the visible text of an lxml element, skipping script and style contents."""
+    parts = element.xpath(".//text()[not(ancestor::script) and not(ancestor::style)]")
+    return ' '.join(' '.join(parts).split())
+
+
+def parse_article_html(content, page_url):
+    """
+    Extracts title, content and cover image URL from a static article page.
+    Returns None if the page does not contain usable article content.
+    """
     try:
-        response = requests.post(url, json=payload, headers=headers, timeout=15)
-        response.raise_for_status()
-        result = response.json()
-        # Expected format may vary, try multiple paths
-        if isinstance(result, list) and len(result) > 0:
-            return result[0]
-        elif isinstance(result, dict):
-            return result.get('translatedText', result.get('translated', text))
-        return text
-    except Exception as e:
-        print(f"Translation Error (RapidAPI): {e}")
-        return f"[Translation failed: {str(e)[:50]}]"
+        tree = lxml_html.fromstring(content)
+    except (ValueError, lxml_html.etree.ParserError):
+        return None
+
+    title = None
+    for xpath in ARTICLE_TITLE_XPATHS:
+        for element in tree.xpath(xpath):
+            title = _element_text(element)
+            if title:
+                break
+        if title:
+            break
+
+    body = None
+    for xpath in ARTICLE_CONTENT_XPATHS:
+        for element in tree.xpath(xpath):
+            body = _element_text(element)
+            if len(body) > 50:
+                break
+        if body and len(body) > 50:
+            break
+
+    if not body or len(body) <= 50:
+        return None
+
+    img_url = None
+    for xpath in ARTICLE_IMAGE_XPATHS:
+        for element in tree.xpath(xpath):
+            img_url = element.get('src') or element.get('data-src')
+            if img_url and ('http' in img_url or img_url.startswith('/')):
+                break
+            img_url = None
+        if img_url:
+            img_url = urljoin(page_url, img_url)
+            break
+
+    return {'title': title, 'content': body, 'image_url': img_url}
 
 # --- CORE LOGIC CLASS ---
 
+# Chrome/Edge preferences: Spanish content and no image rendering (only <img src> is needed)
+CHROMIUM_PREFS = {
+    'intl.accept_languages': 'es,es-ES',
+    'profile.managed_default_content_settings.images': 2,
+}
+
 class ElPaisScraperBrowserStack:
     def __init__(self, browserstack_caps: dict):
         self.caps = browserstack_caps
         self.driver = None
+        self.page_load_strategy = 'normal'
         self.scraped_articles = []
         self.session_name = self.caps.get("bstack:options", {}).get("sessionName", "Unknown Session")
+        self._safe_session_name = _UNSAFE_CHARS_RE.sub('_', self.session_name)
         self.setup_driver()
 
     def setup_driver(self):
@@ -117,14 +401,15 @@ class ElPaisScraperBrowserStack:
         if 'chrome' in browser_name:
             options = ChromeOptions()
             options.add_argument('--lang=es')
-            options.add_experimental_option('prefs', {'intl.accept_languages': 'es,es-ES'})
+            options.add_experimental_option('prefs', CHROMIUM_PREFS)
         elif 'firefox' in browser_name:
             options = FirefoxOptions()
             options.set_preference("intl.accept_languages", "es,es-ES")
+            options.set_preference("permissions.default.image", 2)
         elif 'edge' in browser_name:
             options = EdgeOptions()
             options.add_argument('--lang=es')
-            options.add_experimental_option('prefs', {'intl.accept_languages': 'es,es-ES'})
+            options.add_experimental_option('prefs', CHROMIUM_PREFS)
         elif 'safari' in browser_name:
             options = SafariOptions()
             # Safari doesn't support language preferences via options
@@ -132,8 +417,13 @@ class ElPaisScraperBrowserStack:
             # Default to ChromeOptions
             options = ChromeOptions()
             options.add_argument('--lang=es')
-            options.add_experimental_option('prefs', {'intl.accept_languages': 'es,es-ES'})
+            options.add_experimental_option('prefs', CHROMIUM_PREFS)
             
+        # Return control at DOMContentLoaded; images are downloaded separately via requests
+        if 'safari' not in browser_name:
+            options.page_load_strategy = 'eager'
+        self.page_load_strategy = options.page_load_strategy
+
         # Set BrowserStack capabilities in options
         for key, value in bstack_options.items():
             options.set_capability(f"bstack:{key}", value)
@@ -151,7 +441,7 @@ class ElPaisScraperBrowserStack:
                 command_executor=bs_url,
                 options=options
             )
-            self.driver.set_page_load_timeout(30)
+            self.driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
         except WebDriverException as e:
             print(f"Error connecting to BrowserStack for {self.session_name}: {e}")
             raise
@@ -159,12 +449,9 @@ class ElPaisScraperBrowserStack:
     def scrape_articles(self):
         """Navigates to Opinion, scrapes 5 links, then performs deep scraping and image download."""
         
-        if not os.path.exists(IMAGES_DIR):
-            os.makedirs(IMAGES_DIR)
-
         try:
-            self.driver.get(BASE_URL)
-            time.sleep(3)  # Allow page to fully load
+            self._navigate(BASE_URL)
+            self._wait_idle()
             
             # Handle cookie consent or popups
             try:
@@ -181,7 +468,10 @@ class ElPaisScraperBrowserStack:
                         )
                         btn.click()
                         print(f"{self.session_name}: Closed cookie/consent banner")
-                        time.sleep(1)
+                        try:
+                            WebDriverWait(self.driver, 2).until(EC.invisibility_of_element(btn))
+                        except TimeoutException:
+                            pass
                         break
                     except:
                         continue
@@ -190,12 +480,12 @@ class ElPaisScraperBrowserStack:
             
             # Navigate directly to Opinion section (more reliable)
             print(f"{self.session_name}: Navigating to Opinion section...")
-            self.driver.get(f"{BASE_URL}/opinion/")
-            time.sleep(3)
+            self._navigate(f"{BASE_URL}/opinion/")
+            self._wait_for(By.CSS_SELECTOR, "article, .c_a, h2 a")
 
             # Find the first five articles with multiple fallback strategies
-            article_elements = []
             article_selectors = [
+                'article:has(a[href*="/opinion/"])',
                 "article",
                 ".c_a",
                 "[data-dtm-region]",
@@ -203,157 +493,84 @@ class ElPaisScraperBrowserStack:
                 ".story",
                 "h2 a",
             ]
+            candidates = self.driver.execute_script(EXTRACT_ARTICLE_LINKS_JS, article_selectors) or []
             
-            for selector in article_selectors:
-                try:
-                    article_elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    if len(article_elements) >= 5:
-                        print(f"{self.session_name}: Found articles using selector: {selector}")
-                        break
-                except NoSuchElementException:
-                    continue
-            
-            article_links = []
-            seen_urls = set()
-            for i, element in enumerate(article_elements):
+            # Keyed by URL so duplicates are rejected by the dict itself
+            article_links = {}
+            for i, candidate in enumerate(candidates):
                 if len(article_links) >= 5:
                     break
                 try:
-                    # Try multiple methods to get article URL
-                    url = None
-                    if element.tag_name == 'a':
-                        url = element.get_attribute('href')
-                    else:
-                        # Look for anchor tag within element
-                        try:
-                            link_elem = element.find_element(By.TAG_NAME, 'a')
-                            url = link_elem.get_attribute('href')
-                        except:
-                            pass
-                    
-                    # Try multiple methods to get title
-                    title = None
-                    title_selectors = [
-                        (By.TAG_NAME, 'h2'),
-                        (By.TAG_NAME, 'h3'),
-                        (By.CSS_SELECTOR, '.c_t'),
-                        (By.CSS_SELECTOR, '[data-dtm-region] a'),
-                        (By.TAG_NAME, 'a'),
-                    ]
+                    url = candidate.get('url')
+                    title = candidate.get('title')
                     
-                    for by, sel in title_selectors:
-                        try:
-                            title_elem = element.find_element(by, sel)
-                            title = title_elem.text.strip()
-                            if title:
-                                break
-                        except:
-                            continue
-                    
-                    # Validate URL is an article (not image, section link, etc.)
-                    if url and title and ('//' in url or url.startswith('/')) and len(title) > 10:
-                        if not url.startswith('http'):
-                            url = BASE_URL + url if url.startswith('/') else BASE_URL + '/' + url
-                        # Avoid duplicates and ensure it's a valid article URL
-                        if url not in seen_urls and '/opinion/' in url:
-                            article_links.append({'url': url, 'title_es': title})
-                            seen_urls.add(url)
-                            print(f"{self.session_name}: Found article {len(article_links)}: {title[:60]}...")
+                    # Validate URL is an Opinion article (not image, section link, etc.)
+                    if not url or not title or len(title) <= 10:
+                        continue
+                    if url.startswith('/'):
+                        url = BASE_URL + url
+                    if not url.startswith(OPINION_URL_PREFIX):
+                        continue
+                    # Avoid duplicates
+                    if url not in article_links:
+                        article_links[url] = {'url': url, 'title_es': title}
+                        print(f"{self.session_name}: Found article {len(article_links)}: {title[:60]}...")
                 except Exception as e:
                     print(f"{self.session_name}: Error extracting article {i}: {e}")
                     continue
+            article_links = list(article_links.values())
             
             if not article_links:
                 print(f"{self.session_name}: Error: Could not find any article links.")
                 return
 
-            # Deep scrape each article (full content + image)
+            # Fetch article pages concurrently over HTTP; Selenium is only a fallback
+            static_pages = self._fetch_articles_static(article_links)
+
+            # Deep scrape each article (full content + image URL)
+            image_tasks = []
             for i, article in enumerate(article_links):
                 print(f"\n{self.session_name}: Scraping article {i+1}/5: {article['title_es'][:50]}...")
-                self.driver.get(article['url'])
-                time.sleep(2)
+                page = static_pages[i]
 
-                # 2. SCRAPE FULL TITLE AND CONTENT
-                try:
-                    # Try multiple selectors for title
-                    final_title_es = None
-                    title_selectors = [
-                        (By.TAG_NAME, 'h1'),
-                        (By.CSS_SELECTOR, 'header h1'),
-                        (By.CSS_SELECTOR, '.a_t'),
-                        (By.CSS_SELECTOR, '.article-header h1'),
-                        (By.CSS_SELECTOR, '[data-dtm-region="articulo_titulo"]'),
-                    ]
-                    
-                    for by, sel in title_selectors:
-                        try:
-                            final_title_es = self.driver.find_element(by, sel).text
-                            if final_title_es:
-                                break
-                        except:
-                            continue
-                    
-                    if final_title_es:
-                        article['title_es'] = final_title_es
-                    
-                    # Try multiple selectors for content
-                    full_content_es = None
-                    content_selectors = [
-                        (By.CSS_SELECTOR, 'article[data-dtm-region]'),
-                        (By.CSS_SELECTOR, '.article_body'),
-                        (By.CSS_SELECTOR, '.a_c'),
-                        (By.TAG_NAME, 'article'),
-                        (By.CSS_SELECTOR, '.articulo-cuerpo'),
-                    ]
-                    
-                    for by, sel in content_selectors:
-                        try:
-                            full_content_element = self.driver.find_element(by, sel)
-                            full_content_es = full_content_element.text
-                            if full_content_es and len(full_content_es) > 50:
-                                break
-                        except:
-                            continue
-                    
-                    article['content_es'] = full_content_es if full_content_es else "CONTENT NOT SCRAPED"
-                    
-                except Exception as e:
-                    print(f"{self.session_name}: Error scraping content: {e}")
-                    article['content_es'] = "CONTENT NOT SCRAPED"
-                    
-                # 3. DOWNLOAD COVER IMAGE
-                try:
-                    img_url = None
-                    img_selectors = [
-                        (By.CSS_SELECTOR, 'article img'),
-                        (By.CSS_SELECTOR, 'figure img'),
-                        (By.CSS_SELECTOR, '.a_m img'),
-                        (By.CSS_SELECTOR, '[data-dtm-region] img'),
-                        (By.TAG_NAME, 'img'),
-                    ]
-                    
-                    for by, sel in img_selectors:
-                        try:
-                            img_element = self.driver.find_element(by, sel)
-                            img_url = img_element.get_attribute('src') or img_element.get_attribute('data-src')
-                            if img_url and ('http' in img_url or img_url.startswith('/')):
-                                break
-                        except:
-                            continue
-                    
-                    if img_url:
-                        if not img_url.startswith('http'):
-                            img_url = BASE_URL + img_url if img_url.startswith('/') else BASE_URL + '/' + img_url
-                        article['image_path'] = self._download_image(img_url, i+1, self.session_name)
-                    else:
-                        article['image_path'] = "No image URL found"
-                        
-                except Exception as e:
-                    print(f"{self.session_name}: Error downloading image: {e}")
-                    article['image_path'] = "No cover image element found"
+                if not page:
+                    self._navigate(article['url'])
+                    self._wait_for(By.TAG_NAME, "h1")
+
+                    # 2. SCRAPE FULL TITLE, CONTENT AND IMAGE URL IN ONE CALL
+                    try:
+                        page = self.driver.execute_script(EXTRACT_ARTICLE_PAGE_JS)
+                    except WebDriverException as e:
+                        print(f"{self.session_name}: Error scraping content: {e}")
+                        page = None
+
+                if page and page.get('title'):
+                    article['title_es'] = page['title']
+                article['content_es'] = (page and page.get('content')) or "CONTENT NOT SCRAPED"
+
+                img_url = page.get('image_url') if page else None
+                if img_url:
+                    if not img_url.startswith('http'):
+                        img_url = BASE_URL + img_url if img_url.startswith('/') else BASE_URL + '/' + img_url
+                    image_tasks.append((article, img_url, i+1))
+                else:
+                    article['image_path'] = "No image URL found"
                     
                 self.scraped_articles.append(article)
 
+            # 3. DOWNLOAD COVER IMAGES CONCURRENTLY
+            with ThreadPoolExecutor(max_workers=5) as executor:
+                futures = {
+                    executor.submit(self._download_image, img_url, index): article
+                    for article, img_url, index in image_tasks
+                }
+                for future in as_completed(futures):
+                    try:
+                        futures[future]['image_path'] = future.result()
+                    except Exception as e:
+                        print(f"{self.session_name}: Error downloading image: {e}")
+                        futures[future]['image_path'] = "Download failed."
+
         except Exception as e:
             print(f"{self.session_name}: Critical error during scraping: {e}")
         finally:
@@ -361,22 +578,93 @@ class ElPaisScraperBrowserStack:
                 self.driver.quit()
                 print(f"Session closed for: {self.session_name}")
 
-    def _download_image(self, url, index, session_name):
+    def _navigate(self, url):
+        """
+        Loads a URL. If the page load timeout is hit (e.g. slow ads or trackers), stops
+        the remaining loads and continues with the DOM that is already available.
+        """
+        try:
+            self.driver.get(url)
+        except TimeoutException:
+            print(f"{self.session_name}: Page load timed out for {url}, continuing with partial page")
+            self.driver.execute_script("window.stop();")
+
+    def _wait_idle(self, timeout=10):
+        """
+        Polls document.readyState until the page is ready. With the eager page load
+        strategy "interactive" (DOMContentLoaded) is enough; otherwise waits for "complete".
+        """
+        ready_states = ("interactive", "complete") if self.page_load_strategy == 'eager' else ("complete",)
+        try:
+            WebDriverWait(self.driver, timeout).until(
+                lambda d: d.execute_script("return document.readyState") in ready_states
+            )
+            return True
+        except TimeoutException:
+            print(f"{self.session_name}: Timed out waiting for page to load")
+            return False
+
+    def _wait_for(self, by, selector, timeout=10):
+        """Waits until an element matching the locator is present. Returns False on timeout."""
+        try:
+            WebDriverWait(self.driver, timeout).until(
+                EC.presence_of_element_located((by, selector))
+            )
+            return True
+        except TimeoutException:
+            print(f"{self.session_name}: Timed out waiting for '{selector}'")
+            return False
+
+    def _fetch_articles_static(self, article_links):
+        """
+        Fetches and parses article pages concurrently over HTTP, reusing the browser's cookies.
+        Returns a list aligned with article_links; entries are None where Selenium is still needed.
+        """
+        try:
+            cookies = {c['name']: c['value'] for c in self.driver.get_cookies()}
+            headers = {
+                "User-Agent": self.driver.execute_script("return navigator.userAgent"),
+                "Accept-Language": "es,es-ES",
+            }
+        except WebDriverException as e:
+            print(f"{self.session_name}: Could not read browser cookies, using Selenium for articles: {e}")
+            return [None] * len(article_links)
+
+        session = get_http_session()
+
+        def fetch(article):
+            try:
+                response = session.get(article['url'], cookies=cookies, headers=headers, timeout=15)
+                response.raise_for_status()
+                return parse_article_html(response.content, response.url)
+            except Exception as e:
+                print(f"{self.session_name}: Static fetch failed for {article['url']}: {e}")
+                return None
+
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            return list(executor.map(fetch, article_links))
+
+    def _download_image(self, url, index):
         """Downloads an image from a URL and saves it locally."""
         try:
-            response = requests.get(url, stream=True)
+            response = get_http_session().get(url, stream=True)
             response.raise_for_status()
+
+            # Skip absurdly large payloads before reading the body
+            content_length = response.headers.get('content-length')
+            if content_length and content_length.isdigit() and int(content_length) > MAX_IMAGE_BYTES:
+                response.close()
+                return "Download skipped: image too large."
             
-            file_extension = url.split('.')[-1].split('?')[0]
+            file_extension = os.path.splitext(urlparse(url).path)[1].lstrip('.').lower()
             if not file_extension or len(file_extension) > 4:
                 file_extension = 'jpg'
                 
-            safe_session_name = re.sub(r'[^a-zA-Z0-9]', '_', session_name)
-            file_name = os.path.join(IMAGES_DIR, f"article_{index}_{safe_session_name}.{file_extension}")
+            file_name = os.path.join(IMAGES_DIR, f"article_{index}_{self._safe_session_name}.{file_extension}")
             
-            with open(file_name, 'wb') as f:
-                for chunk in response.iter_content(1024):
-                    f.write(chunk)
+            with response, open(file_name, 'wb') as f:
+                response.raw.decode_content = True
+                shutil.copyfileobj(response.raw, f, length=IMAGE_CHUNK_SIZE)
             
             return file_name
         except Exception:
@@ -391,32 +679,43 @@ def analyze_data(articles: list, session_name: str):
         print(f"\n--- {session_name}: ANALYSIS FAILED: No articles scraped. ---")
         return
 
-    # Load environment variables (for RapidAPI)
-    load_dotenv()
-
     all_translated_titles = []
     
     print("\n" + "="*50)
     print(f"--- {session_name}: RESULTS & ANALYSIS ---")
     print("="*50)
     
-    for i, article in enumerate(articles):
-        print(f"\n[ ARTICLE {i+1} ]")
-        
+    # Read each article's fields once
+    fields = [
+        (article.get('title_es', ''), article.get('content_es', ''), article.get('image_path', 'N/A'))
+        for article in articles
+    ]
+
+    # Translate all eligible headers to English in a single RapidAPI request
+    to_translate = [
+        i for i, (title_es, content_es, _) in enumerate(fields)
+        if title_es and content_es != "CONTENT NOT SCRAPED"
+    ]
+    try:
+        translations = rapidapi_translate_many([fields[i][0] for i in to_translate], "es", "en")
+    except Exception as e:
+        print(f"Translation Error (RapidAPI): {e}")
+        translations = []
+    translated_by_index = dict(zip(to_translate, translations))
+
+    for i, (title_es, content_es, image_path) in enumerate(fields):
         # Print title and content in Spanish
-        print(f"Spanish Title: {article.get('title_es', 'N/A')}")
-        print(f"Spanish Content (Snippet): {article.get('content_es', 'N/A')[:250]}...")
-        print(f"Image Status: {article.get('image_path', 'N/A')}")
+        print(
+            f"\n[ ARTICLE {i+1} ]\n"
+            f"Spanish Title: {title_es or 'N/A'}\n"
+            f"Spanish Content (Snippet): {(content_es or 'N/A')[:250]}...\n"
+            f"Image Status: {image_path}"
+        )
         
-        # Translate headers to English using RapidAPI
-        title_es = article.get('title_es', '')
-        if title_es and article.get('content_es', '') != "CONTENT NOT SCRAPED":
-            try:
-                title_en = rapidapi_translate(title_es, "es", "en")
-                all_translated_titles.append(title_en)
-                print(f"Translated Header (EN): {title_en}")
-            except Exception as e:
-                print(f"Translation Error (RapidAPI): {e}")
+        title_en = translated_by_index.get(i)
+        if title_en is not None:
+            all_translated_titles.append(title_en)
+            print(f"Translated Header (EN): {title_en}")
         
         print("-" * 50)
 
@@ -425,15 +724,15 @@ def analyze_data(articles: list, session_name: str):
     print(f"\n--- {session_name}: Word Repetition Analysis (Words repeated > 2 times) ---")
     
     combined_text = ' '.join(all_translated_titles)
-    words = re.findall(r'\b\w+\b', combined_text.lower())
-    stop_words = set(['the', 'a', 'an', 'and', 'to', 'in', 'is', 'it', 'for', 'of', 'on', 'with', 'from', 'at', 'by'])
-    filtered_words = [word for word in words if word not in stop_words and len(word) > 1]
+    words = _WORD_RE.findall(combined_text.lower())
+    filtered_words = [word for word in words if word not in _STOP_WORDS and len(word) > 1]
     word_counts = Counter(filtered_words)
-    repeated_words = {word: count for word, count in word_counts.items() if count > 2}
+    # most_common() is sorted by count, so stop at the first word at or below the threshold
+    repeated_words = list(takewhile(lambda item: item[1] > 2, word_counts.most_common()))
 
     if repeated_words:
         print("\nWords Repeated More Than Twice:")
-        for word, count in repeated_words.items():
+        for word, count in repeated_words:
             print(f" - '{word}': {count} times")
     else:
         print("No words were repeated more than twice across the translated headers (after filtering stop words).")
@@ -458,19 +757,12 @@ if __name__ == '__main__':
     print("--- EL PAÍS SCRAPER (BROWSERSTACK PARALLEL TESTING) ---")
     print("=" * 60)
     
-    processes = []
-    
-    # Initiate 5 parallel BrowserStack sessions
-    print(f"\nStarting {len(PARALLEL_CAPS)} parallel test processes on BrowserStack...\n")
+    # Initiate 5 parallel BrowserStack sessions (I/O-bound, so threads are sufficient)
+    print(f"\nStarting {len(PARALLEL_CAPS)} parallel test threads on BrowserStack...\n")
     
-    for caps in PARALLEL_CAPS:
-        p = Process(target=run_test_process, args=(caps,))
-        processes.append(p)
-        p.start()
-
-    # Wait for all processes to complete
-    for p in processes:
-        p.join()
+    # Wait for all sessions to complete
+    with ThreadPoolExecutor(max_workers=max(1, len(PARALLEL_CAPS))) as executor:
+        list(executor.map(run_test_process, PARALLEL_CAPS))
 
     print("\n" + "="*60)
     print("--- ALL BROWSERSTACK SESSIONS COMPLETE ---")